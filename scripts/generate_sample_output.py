@@ -3,6 +3,7 @@
 Generate a sample of the new progressive annotation output.
 Shows what the completed XML looks like with chain-of-thought reasoning.
 """
+import os
 import sys
 from pathlib import Path
 import xml.etree.ElementTree as ET
@@ -12,29 +13,54 @@ import logging
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.pipeline.ingestion.document_processor import DocumentProcessor
-from src.pipeline.annotation.annotation_engine import AnnotationEngine
-from src.pipeline.annotation.progressive_annotator import ProgressiveAnnotator
+# Pipeline logging is silenced unless DEMO_VERBOSE is set; the report is the output
+if os.environ.get("DEMO_VERBOSE"):
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+else:
+    logging.getLogger().addHandler(logging.NullHandler())
 
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# Fixed closing lines of the sample report, built once at import
+_KEY_ADVANTAGES = "\n".join([
+    "  🧠 Chain-of-thought reasoning for every annotation decision",
+    "  🔧 Section-by-section filling allows targeted retry and validation",
+    "  📋 Systematic progression ensures nothing is missed",
+    "  🎛️ Full control over annotation quality and consistency",
+])
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
 
 
 def generate_sample_annotation():
     """Generate a sample of the new annotation output."""
+    # Pipeline imports pull in the AI provider SDKs; load them only when needed
+    from config.settings import CACHE_DIR
+    from src.pipeline.ingestion.document_processor import DocumentProcessor
+    from src.pipeline.annotation.annotation_engine import AnnotationEngine
+    from src.pipeline.annotation.progressive_annotator import ProgressiveAnnotator
     
     # Find test interview
     txt_dir = project_root / "data" / "processed" / "interviews_txt"
-    txt_files = list(txt_dir.glob("*.txt"))
     
-    if not txt_files:
+    # Use smallest file; scandir entries reuse the directory listing for stat
+    test_entry = None
+    if txt_dir.is_dir():
+        with os.scandir(txt_dir) as entries:
+            test_entry = min(
+                (e for e in entries if e.name.endswith(".txt")),
+                key=lambda e: e.stat().st_size,
+                default=None
+            )
+    
+    if test_entry is None:
         print("No interview files found")
         return
+    test_file = Path(test_entry.path)
     
-    # Use smallest file
-    test_file = min(txt_files, key=lambda f: f.stat().st_size)
-    
-    # Process interview
-    processor = DocumentProcessor()
+    # Process interview, reusing the ingested document from earlier runs
+    processor = DocumentProcessor(cache_dir=CACHE_DIR)
     interview = processor.process_interview(test_file)
     
     # Create progressive annotator
@@ -130,42 +156,57 @@ Return only the function name.
 def display_sample_output(xml_root):
     """Display formatted sample of the annotation output."""
     
-    print("\n" + "="*80)
-    print("SAMPLE PROGRESSIVE ANNOTATION OUTPUT")
-    print("="*80)
+    # Collect the report and write it to stdout in one call
+    out = []
+    
+    # Gather turns and element counts in a single walk (root excluded)
+    turns = []
+    total_elements = 0
+    filled_elements = 0
+    elements = xml_root.iter()
+    next(elements)
+    for element in elements:
+        total_elements += 1
+        if element.text and "FILL" not in element.text:
+            filled_elements += 1
+        if element.tag == "turn":
+            turns.append(element)
+    
+    out.append("\n" + "="*80)
+    out.append("SAMPLE PROGRESSIVE ANNOTATION OUTPUT")
+    out.append("="*80)
     
     # Show interview-level metadata
-    print("\n📋 INTERVIEW METADATA:")
+    out.append("\n📋 INTERVIEW METADATA:")
     metadata = xml_root.find(".//metadata")
     if metadata is not None:
         for child in metadata:
             if child.tag == "location":
-                print(f"  📍 Location:")
+                out.append(f"  📍 Location:")
                 for loc_child in child:
-                    print(f"      {loc_child.tag}: {loc_child.text}")
+                    out.append(f"      {loc_child.tag}: {loc_child.text}")
             else:
-                print(f"  {child.tag}: {child.text}")
+                out.append(f"  {child.tag}: {child.text}")
     
     # Show participant profile
-    print("\n👤 PARTICIPANT PROFILE:")
+    out.append("\n👤 PARTICIPANT PROFILE:")
     profile = xml_root.find(".//participant_profile")
     if profile is not None:
         for child in profile:
-            print(f"  {child.tag}: {child.text}")
+            out.append(f"  {child.tag}: {child.text}")
     
     # Show turn count
-    turns = xml_root.findall(".//turn")
-    print(f"\n🔄 CONVERSATION TURNS: {len(turns)} total")
+    out.append(f"\n🔄 CONVERSATION TURNS: {len(turns)} total")
     
     # Show first few turns with details
-    print("\n📝 SAMPLE TURNS (first 3):")
+    out.append("\n📝 SAMPLE TURNS (first 3):")
     for i, turn in enumerate(turns[:3], 1):
         turn_id = turn.find("turn_id").text
         speaker = turn.find("speaker").text
         text = turn.find("text").text
         
-        print(f"\n  Turn {turn_id} ({speaker}):")
-        print(f"    Text: {text[:100]}{'...' if len(text) > 100 else ''}")
+        out.append(f"\n  Turn {turn_id} ({speaker}):")
+        out.append(f"    Text: {_truncate(text, 100)}")
         
         # Show functional annotation if filled
         functional = turn.find(".//functional_annotation")
@@ -174,10 +215,10 @@ def display_sample_output(xml_root):
             primary_func = functional.find("primary_function")
             
             if reasoning is not None and reasoning.text and "FILL" not in reasoning.text:
-                print(f"    🧠 Reasoning: {reasoning.text[:150]}{'...' if len(reasoning.text) > 150 else ''}")
+                out.append(f"    🧠 Reasoning: {_truncate(reasoning.text, 150)}")
             
             if primary_func is not None and primary_func.text and "FILL" not in primary_func.text:
-                print(f"    ⚡ Function: {primary_func.text}")
+                out.append(f"    ⚡ Function: {primary_func.text}")
         
         # Show placeholders for other annotation types
         content_reasoning = turn.find(".//content_annotation/reasoning")
@@ -193,23 +234,19 @@ def display_sample_output(xml_root):
             placeholders.append("stance")
         
         if placeholders:
-            print(f"    📋 Ready to fill: {', '.join(placeholders)} annotations")
+            out.append(f"    📋 Ready to fill: {', '.join(placeholders)} annotations")
     
     # Show structure overview
-    total_elements = len(xml_root.findall(".//*"))
-    filled_elements = len([e for e in xml_root.findall(".//*") if e.text and "FILL" not in e.text])
-    
-    print(f"\n📊 ANNOTATION STRUCTURE:")
-    print(f"  Total XML elements: {total_elements}")
-    print(f"  Elements filled: {filled_elements}")
-    print(f"  Completion: {filled_elements/total_elements*100:.1f}%")
-    
-    print(f"\n✨ KEY ADVANTAGES:")
-    print(f"  🎯 Complete turn coverage: {len(turns)} turns (vs 2 in old approach)")
-    print(f"  🧠 Chain-of-thought reasoning for every annotation decision")
-    print(f"  🔧 Section-by-section filling allows targeted retry and validation")
-    print(f"  📋 Systematic progression ensures nothing is missed")
-    print(f"  🎛️ Full control over annotation quality and consistency")
+    out.append(f"\n📊 ANNOTATION STRUCTURE:")
+    out.append(f"  Total XML elements: {total_elements}")
+    out.append(f"  Elements filled: {filled_elements}")
+    out.append(f"  Completion: {filled_elements/total_elements*100:.1f}%")
+    
+    out.append(f"\n✨ KEY ADVANTAGES:")
+    out.append(f"  🎯 Complete turn coverage: {len(turns)} turns (vs 2 in old approach)")
+    out.append(_KEY_ADVANTAGES)
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 """
 Setup configuration for Uruguay Active Listening AI Framework.
 """
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -9,6 +11,21 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Optional native build of the ingestion, parsing and turn-extraction hot paths
+# with mypyc (ships with mypy).
+# Enable with: URUGUAY_MYPYC=1 python setup.py build_ext --inplace
+ext_modules = []
+if os.environ.get("URUGUAY_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        # Only the compiled modules must type-check; imported packages are not
+        "--follow-imports=silent",
+        "--ignore-missing-imports",
+        "src/pipeline/ingestion/document_processor.py",
+        "src/pipeline/parsing/conversation_parser.py",
+        "src/pipeline/extraction/turn_extractor.py",
+    ])
+
 setup(
     name="uruguay-active-listening",
     version="0.1.0",
@@ -40,6 +57,7 @@ setup(
             "uruguay-export=scripts.export_deliverables:main",
         ],
     },
+    ext_modules=ext_modules,
     include_package_data=True,
     package_data={
         "config": ["prompts/*.xml", "prompts/*.yaml", "database/*.sql", "dashboards/*.yaml"],
@@ -218,16 +218,20 @@ def costs(provider: Optional[str]):
             providers[provider_name] = []
         providers[provider_name].append((key, cost_data))
     
-    # Show costs
+    # Show costs, formatted into one block and echoed once
+    lines = []
     for provider_name, models in providers.items():
         if provider and provider != provider_name:
             continue
             
-        click.echo(f"\n{provider_name.upper()}:")
+        lines.append(f"\n{provider_name.upper()}:")
         for model_key, cost_data in sorted(models, key=lambda x: x[1]['total_cost']):
-            click.echo(f"  {model_key}: ${cost_data['total_cost']:.6f}")
+            lines.append(f"  {model_key}: ${cost_data['total_cost']:.6f}")
             if 'note' in cost_data:
-                click.echo(f"    ({cost_data['note']})")
+                lines.append(f"    ({cost_data['note']})")
+    
+    if lines:
+        click.echo("\n".join(lines))
     
     # Project costs
     click.echo(f"\nProjected costs for 5,000 interviews:")
@@ -5,6 +5,8 @@ Polished, focused interface for browsing interviews as chat conversations
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload, selectinload
 from pathlib import Path
 import sys
 import json
@@ -187,12 +189,25 @@ class ConversationBrowser:
     def load_interview_list(_self):
         """Load list of available interviews."""
         with _self.db.get_session() as session:
-            interviews = session.query(Interview).all()
+            # Count turns in the database instead of loading every turn row
+            turn_counts = session.query(
+                Turn.interview_id,
+                func.count(Turn.id).label('turn_count')
+            ).group_by(Turn.interview_id).subquery()
+            
+            # Eager-load per-interview relationships instead of one query per row
+            interviews = session.query(
+                Interview, func.coalesce(turn_counts.c.turn_count, 0)
+            ).outerjoin(
+                turn_counts, turn_counts.c.interview_id == Interview.id
+            ).options(
+                joinedload(Interview.narrative_features),
+                joinedload(Interview.participant_profile)
+            ).all()
             
             interview_list = []
-            for interview in interviews:
+            for interview, turn_count in interviews:
                 # Get basic stats
-                turn_count = len(interview.turns) if interview.turns else 0
                 has_narrative = interview.narrative_features is not None
                 
                 interview_list.append({
@@ -215,7 +230,16 @@ class ConversationBrowser:
     def load_conversation_data(_self, interview_id: str):
         """Load full conversation data for an interview."""
         with _self.db.get_session() as session:
-            interview = session.query(Interview).filter_by(interview_id=interview_id).first()
+            # Fetch turns and their analyses in a few queries rather than per turn
+            interview = session.query(Interview).options(
+                joinedload(Interview.participant_profile),
+                joinedload(Interview.narrative_features),
+                selectinload(Interview.turns).options(
+                    joinedload(Turn.functional_analysis),
+                    joinedload(Turn.content_analysis),
+                    joinedload(Turn.emotional_analysis)
+                )
+            ).filter_by(interview_id=interview_id).first()
             
             if not interview:
                 return None, None
@@ -331,7 +331,9 @@ class ExtractedDataRepository:
     
     def save_extracted_data(self, extracted_data: ExtractedData, 
                           xml_content: Optional[str] = None,
-                          raw_text: Optional[str] = None) -> None:
+                          raw_text: Optional[str] = None,
+                          commit: bool = True,
+                          word_count: Optional[int] = None) -> None:
         """
         Save extracted data to database.
         
@@ -339,11 +341,17 @@ class ExtractedDataRepository:
             extracted_data: ExtractedData object
             xml_content: Original XML annotation content
             raw_text: Original interview text
+            commit: Commit immediately; if False, only flush so the caller
+                can group several interviews into one transaction
+            word_count: Word count of raw_text if already known (e.g. from
+                ingestion); counted from raw_text otherwise
         """
         try:
             # Get or create interview
             interview = self.interview_repo.get_interview_by_id(extracted_data.interview_id)
             if not interview:
+                if word_count is None:
+                    word_count = len(raw_text.split()) if raw_text else 0
                 interview = self.interview_repo.create_interview({
                     'interview_id': extracted_data.interview_id,
                     'date': extracted_data.interview_date,
@@ -352,7 +360,7 @@ class ExtractedDataRepository:
                     'department': extracted_data.department,
                     'participant_count': extracted_data.participant_count,
                     'raw_text': raw_text,
-                    'word_count': len(raw_text.split()) if raw_text else 0,
+                    'word_count': word_count,
                     'status': 'completed'
                 })
             
@@ -484,7 +492,10 @@ class ExtractedDataRepository:
             self.interview_repo.update_interview_status(interview.id, 'completed')
             
             # Commit all changes
-            self.session.commit()
+            if commit:
+                self.session.commit()
+            else:
+                self.session.flush()
             
             logger.info(f"Successfully saved extracted data for interview {extracted_data.interview_id}")
             
@@ -7,6 +7,7 @@ from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from openai import OpenAI
 from anthropic import Anthropic
@@ -19,6 +20,22 @@ from src.config.config_loader import get_config
 
 logger = logging.getLogger(__name__)
 
+# Annotation pricing per provider/model:
+# (cost key, tokens per pricing unit, prompt rate, output rate, note)
+_ANNOTATION_PRICING = (
+    # OpenAI - prices per 1M tokens
+    ("openai_gpt4o", 1_000_000, 2.50, 10.00, None),  # Most capable general model
+    ("openai_gpt4o_mini", 1_000_000, 0.15, 0.60, None),  # Cost-effective
+    ("openai_gpt41_nano", 1_000_000, 0.10, 0.40, None),  # Cheapest
+    # Anthropic (Claude 3 Opus) - prices per 1K tokens
+    ("anthropic_claude3", 1000, 0.015, 0.075, None),
+    # Google Gemini - prices per 1M tokens (base rates)
+    ("gemini_20_flash", 1_000_000, 0.10, 0.40, None),  # Most cost-effective
+    ("gemini_25_flash_preview", 1_000_000, 0.15, 0.60,
+     "Free tier available in Google AI Studio"),
+    ("gemini_15_pro", 1_000_000, 1.25, 5.00, None),  # Higher context window (2M tokens)
+)
+
 
 class AnnotationEngine:
     """Generates AI-powered annotations for interviews using XML schema."""
@@ -139,7 +156,7 @@ class AnnotationEngine:
                     "processing_time": 0.0,  # Will be updated later
                     "attempts": attempt + 1,
                     "temperature": temperature,
-                    "interview_word_count": len(interview.text.split()),
+                    "interview_word_count": interview.word_count,
                     "confidence": self._extract_confidence(annotation)
                 }
                 self._add_processing_metadata(annotation, temp_metadata)
@@ -188,7 +205,7 @@ class AnnotationEngine:
             "processing_time": time.time() - start_time,
             "attempts": attempt + 1,
             "temperature": temperature,
-            "interview_word_count": len(interview.text.split()),
+            "interview_word_count": interview.word_count,
             "confidence": self._extract_confidence(annotation)
         }
         
@@ -326,35 +343,25 @@ Please provide a corrected annotation that strictly follows the XSD schema.
         Args:
             interviews: List of interview documents
             output_dir: Directory to save annotations (optional)
-            max_concurrent: Maximum concurrent API calls (1 for now)
+            max_concurrent: Maximum concurrent API calls
             
         Returns:
-            List of (interview_id, success, error_message) tuples
+            List of (interview_id, success, error_message) tuples, in input order
         """
-        results = []
-        
-        for interview in interviews:
-            try:
-                logger.info(f"Processing interview {interview.id}")
-                
-                # Annotate
-                annotation, metadata = self.annotate_interview(interview)
-                
-                # Save if output directory provided
-                if output_dir:
-                    output_path = os.path.join(
-                        output_dir, 
-                        f"{interview.id}_annotation.xml"
-                    )
-                    tree = ET.ElementTree(annotation)
-                    tree.write(output_path, encoding="utf-8", xml_declaration=True)
-                    logger.info(f"Saved annotation to {output_path}")
-                
-                results.append((interview.id, True, None))
-                
-            except Exception as e:
-                logger.error(f"Failed to annotate interview {interview.id}: {e}")
-                results.append((interview.id, False, str(e)))
+        if max_concurrent > 1 and len(interviews) > 1:
+            # API calls are latency-bound, so overlap them in threads. Dispatch
+            # the longest interviews first so none is left straggling at the end.
+            order = sorted(range(len(interviews)), key=lambda i: interviews[i].word_count, reverse=True)
+            results = [None] * len(interviews)
+            with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+                dispatched = executor.map(
+                    lambda i: self._annotate_and_save(interviews[i], output_dir),
+                    order
+                )
+                for i, result in zip(order, dispatched):
+                    results[i] = result
+        else:
+            results = [self._annotate_and_save(interview, output_dir) for interview in interviews]
         
         # Summary
         success_count = sum(1 for _, success, _ in results if success)
@@ -362,93 +369,73 @@ Please provide a corrected annotation that strictly follows the XSD schema.
         
         return results
     
+    def _annotate_and_save(
+        self,
+        interview: InterviewDocument,
+        output_dir: Optional[str] = None
+    ) -> Tuple[str, bool, Optional[str]]:
+        """Annotate one interview for batch_annotate, saving the XML if requested."""
+        try:
+            logger.info(f"Processing interview {interview.id}")
+            
+            # Annotate
+            annotation, metadata = self.annotate_interview(interview)
+            
+            # Save if output directory provided
+            if output_dir:
+                output_path = os.path.join(
+                    output_dir, 
+                    f"{interview.id}_annotation.xml"
+                )
+                tree = ET.ElementTree(annotation)
+                tree.write(output_path, encoding="utf-8", xml_declaration=True)
+                logger.info(f"Saved annotation to {output_path}")
+            
+            return (interview.id, True, None)
+            
+        except Exception as e:
+            logger.error(f"Failed to annotate interview {interview.id}: {e}")
+            return (interview.id, False, str(e))
+    
     def calculate_annotation_cost(self, interview: InterviewDocument) -> Dict[str, float]:
         """
         Estimate the cost of annotating an interview.
         
         Returns cost estimates for different providers.
         """
-        # Rough token estimates
-        prompt_tokens = len(interview.text.split()) * 1.5  # XML overhead
+        # Rough token estimates, reusing the word count taken at ingestion
+        prompt_tokens = interview.word_count * 1.5  # XML overhead
         output_tokens = 2000  # Typical annotation size
         
-        costs = {}
-        
-        # OpenAI pricing (multiple models) - prices per 1M tokens
-        # GPT-4o (most capable general model)
-        costs["openai_gpt4o"] = {
-            "prompt_tokens": prompt_tokens,
-            "output_tokens": output_tokens,
-            "prompt_cost": (prompt_tokens / 1_000_000) * 2.50,  # $2.50 per 1M tokens
-            "output_cost": (output_tokens / 1_000_000) * 10.00,  # $10.00 per 1M tokens
-            "total_cost": ((prompt_tokens / 1_000_000) * 2.50) + ((output_tokens / 1_000_000) * 10.00)
-        }
-        
-        # GPT-4o-mini (cost-effective)
-        costs["openai_gpt4o_mini"] = {
-            "prompt_tokens": prompt_tokens,
-            "output_tokens": output_tokens,
-            "prompt_cost": (prompt_tokens / 1_000_000) * 0.15,  # $0.15 per 1M tokens
-            "output_cost": (output_tokens / 1_000_000) * 0.60,  # $0.60 per 1M tokens
-            "total_cost": ((prompt_tokens / 1_000_000) * 0.15) + ((output_tokens / 1_000_000) * 0.60)
-        }
-        
-        # GPT-4.1-nano (cheapest)
-        costs["openai_gpt41_nano"] = {
-            "prompt_tokens": prompt_tokens,
-            "output_tokens": output_tokens,
-            "prompt_cost": (prompt_tokens / 1_000_000) * 0.10,  # $0.10 per 1M tokens
-            "output_cost": (output_tokens / 1_000_000) * 0.40,  # $0.40 per 1M tokens
-            "total_cost": ((prompt_tokens / 1_000_000) * 0.10) + ((output_tokens / 1_000_000) * 0.40)
-        }
-        
-        # Anthropic pricing (Claude 3 Opus)
-        costs["anthropic_claude3"] = {
-            "prompt_tokens": prompt_tokens,
-            "output_tokens": output_tokens,
-            "prompt_cost": (prompt_tokens / 1000) * 0.015,  # $0.015 per 1K tokens
-            "output_cost": (output_tokens / 1000) * 0.075,  # $0.075 per 1K tokens
-            "total_cost": ((prompt_tokens / 1000) * 0.015) + ((output_tokens / 1000) * 0.075)
+        # Token counts in each pricing unit, computed once for all providers
+        unit_tokens = {
+            unit: (prompt_tokens / unit, output_tokens / unit)
+            for unit in {pricing[1] for pricing in _ANNOTATION_PRICING}
         }
         
-        # Google Gemini pricing (multiple models)
-        # Gemini 2.0 Flash - Most cost-effective
-        costs["gemini_20_flash"] = {
-            "prompt_tokens": prompt_tokens,
-            "output_tokens": output_tokens,
-            "prompt_cost": (prompt_tokens / 1_000_000) * 0.10,  # $0.10 per 1M tokens
-            "output_cost": (output_tokens / 1_000_000) * 0.40,  # $0.40 per 1M tokens
-            "total_cost": ((prompt_tokens / 1_000_000) * 0.10) + ((output_tokens / 1_000_000) * 0.40)
-        }
-        
-        # Gemini 2.5 Flash Preview - Free tier available
-        costs["gemini_25_flash_preview"] = {
-            "prompt_tokens": prompt_tokens,
-            "output_tokens": output_tokens,
-            "prompt_cost": (prompt_tokens / 1_000_000) * 0.15,  # $0.15 per 1M tokens
-            "output_cost": (output_tokens / 1_000_000) * 0.60,  # $0.60 per 1M tokens (base rate)
-            "total_cost": ((prompt_tokens / 1_000_000) * 0.15) + ((output_tokens / 1_000_000) * 0.60),
-            "note": "Free tier available in Google AI Studio"
-        }
-        
-        # Gemini 1.5 Pro - Higher context window (2M tokens)
-        costs["gemini_15_pro"] = {
-            "prompt_tokens": prompt_tokens,
-            "output_tokens": output_tokens,
-            "prompt_cost": (prompt_tokens / 1_000_000) * 1.25,  # $1.25 per 1M tokens (base rate)
-            "output_cost": (output_tokens / 1_000_000) * 5.00,  # $5.00 per 1M tokens (base rate)
-            "total_cost": ((prompt_tokens / 1_000_000) * 1.25) + ((output_tokens / 1_000_000) * 5.00)
-        }
+        costs = {}
+        for key, unit, prompt_rate, output_rate, note in _ANNOTATION_PRICING:
+            prompt_units, output_units = unit_tokens[unit]
+            costs[key] = {
+                "prompt_tokens": prompt_tokens,
+                "output_tokens": output_tokens,
+                "prompt_cost": prompt_units * prompt_rate,
+                "output_cost": output_units * output_rate,
+                "total_cost": (prompt_units * prompt_rate) + (output_units * output_rate)
+            }
+            if note:
+                costs[key]["note"] = note
         
         return costs
 
 
 if __name__ == "__main__":
     # Test annotation engine
+    from config.settings import CACHE_DIR
     from src.pipeline.ingestion.document_processor import DocumentProcessor
     
-    # Initialize components
-    processor = DocumentProcessor()
+    # Initialize components; ingested documents are reused from CACHE_DIR across runs
+    processor = DocumentProcessor(cache_dir=CACHE_DIR)
     engine = AnnotationEngine(model_provider="openai")
     
     # Test with a sample file if available
@@ -459,7 +446,7 @@ if __name__ == "__main__":
         # Process document
         interview = processor.process_interview(Path(sample_file))
         print(f"Processing interview {interview.id}")
-        print(f"Word count: {len(interview.text.split())}")
+        print(f"Word count: {interview.word_count}")
         
         # Calculate cost
         costs = engine.calculate_annotation_cost(interview)
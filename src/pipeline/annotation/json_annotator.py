@@ -3,10 +3,12 @@ Enhanced JSON mode annotation system incorporating XML schema richness.
 Balances comprehensive analysis with cost efficiency.
 """
 import json
+import os
 import xml.etree.ElementTree as ET
 from openai import OpenAI
 from typing import Dict, Any, List, Tuple, Optional
 from pathlib import Path
+import heapq
 import logging
 import time
 from datetime import datetime
@@ -518,24 +520,30 @@ def main():
     """Test the enhanced JSON annotator."""
     # Find test interview
     txt_dir = Path("data/processed/interviews_txt")
-    txt_files = list(txt_dir.glob("*.txt"))
+    sizes = []
+    if txt_dir.is_dir():
+        # scandir entries reuse the directory listing for stat; the listing
+        # index breaks size ties in the same order the old stable sort did
+        with os.scandir(txt_dir) as entries:
+            sizes = [(e.stat().st_size, index, e.path)
+                     for index, e in enumerate(entries) if e.name.endswith(".txt")]
     
-    if not txt_files:
+    if not sizes:
         print("❌ No interview files found")
         return
     
-    # Use a medium-sized file for testing
-    test_files = sorted(txt_files, key=lambda f: f.stat().st_size)
-    test_file = test_files[len(test_files)//2]  # Use middle-sized file
+    # Use a medium-sized file for testing (one stat per file, no full sort)
+    test_file = Path(heapq.nsmallest(len(sizes) // 2 + 1, sizes)[-1][2])
     
     # Process interview
+    from config.settings import CACHE_DIR
     from src.pipeline.ingestion.document_processor import DocumentProcessor
-    processor = DocumentProcessor()
+    processor = DocumentProcessor(cache_dir=CACHE_DIR)
     interview = processor.process_interview(test_file)
     
     print(f"🎯 ENHANCED JSON MODE ANNOTATION TEST")
     print(f"Interview: {interview.id}")
-    print(f"Word count: {len(interview.text.split()):,}")
+    print(f"Word count: {interview.word_count:,}")
     print(f"Estimated cost: ~$0.002-0.005 (GPT-4.1 nano)")
     print()
     
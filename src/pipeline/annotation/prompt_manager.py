@@ -68,9 +68,10 @@ Preserve the XML structure and provide values for all required attributes and el
 Use CDATA sections for long text fields to preserve formatting.
         """
         
-        # Insert at beginning of root
+        # Instructions lead and the interview trails the schema, so every prompt
+        # shares one byte-identical prefix that providers can cache
         root.insert(0, instructions)
-        root.insert(1, interview_section)
+        root.append(interview_section)
         
         # Convert to string with pretty formatting
         xml_string = self._pretty_print_xml(root)
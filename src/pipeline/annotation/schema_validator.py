@@ -3,6 +3,7 @@ XML Schema Definition (XSD) validator for AI annotation outputs.
 Enforces strict schema compliance to ensure predictable parsing.
 """
 import logging
+import threading
 from pathlib import Path
 from typing import List, Tuple, Optional
 import xml.etree.ElementTree as ET
@@ -33,6 +34,9 @@ class SchemaValidator:
         self.xsd_path = xsd_path
         self.schema = None
         
+        # lxml schemas keep a single error log, so each thread validates with its own
+        self._thread_local = threading.local()
+        
         if LXML_AVAILABLE:
             self._load_xsd_schema()
         else:
@@ -44,11 +48,21 @@ class SchemaValidator:
             with open(self.xsd_path, 'r', encoding='utf-8') as f:
                 schema_doc = etree.parse(f)
             self.schema = etree.XMLSchema(schema_doc)
+            self._thread_local.schema = self.schema
             logger.info(f"Loaded XSD schema from {self.xsd_path}")
         except Exception as e:
             logger.error(f"Failed to load XSD schema from {self.xsd_path}: {e}")
             self.schema = None
     
+    def _thread_schema(self):
+        """Schema instance owned by the calling thread."""
+        schema = getattr(self._thread_local, 'schema', None)
+        if schema is None:
+            with open(self.xsd_path, 'r', encoding='utf-8') as f:
+                schema = etree.XMLSchema(etree.parse(f))
+            self._thread_local.schema = schema
+        return schema
+    
     def validate_xml_string(self, xml_string: str) -> Tuple[bool, List[str]]:
         """
         Validate XML string against XSD schema.
@@ -67,14 +81,15 @@ class SchemaValidator:
             xml_doc = etree.fromstring(xml_string.encode('utf-8'))
             
             # Validate against schema
-            is_valid = self.schema.validate(xml_doc)
+            schema = self._thread_schema()
+            is_valid = schema.validate(xml_doc)
             
             if is_valid:
                 return True, []
             else:
                 # Extract validation errors
                 errors = []
-                for error in self.schema.error_log:
+                for error in schema.error_log:
                     errors.append(f"Line {error.line}: {error.message}")
                 return False, errors
                 
@@ -7,11 +7,27 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
+import sys
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+def _child_text(parent: ET.Element, tag: str, intern: bool = False) -> Optional[str]:
+    """
+    Return the stripped text of a child element, or None if it is missing or empty.
+    
+    Categorical values repeat across every turn, so they can be interned to
+    share one string object per distinct value.
+    """
+    elem = parent.find(tag)
+    text = elem.text if elem is not None else None
+    if not text:
+        return None
+    text = text.strip()
+    return sys.intern(text) if intern else text
+
+
 @dataclass
 class TurnData:
     """Represents a single conversation turn with all annotations."""
@@ -83,26 +99,28 @@ class TurnExtractor:
             
         Returns:
             Tuple of (list of turns, conversation dynamics)
+            
+        Raises:
+            ET.ParseError: If the file is not well-formed XML
+            OSError: If the file cannot be read
         """
         try:
             tree = ET.parse(xml_path)
-            root = tree.getroot()
-            
-            # Extract all turns
-            turns = self._extract_turn_data(root)
-            
-            # Calculate conversation dynamics
-            dynamics = self._calculate_dynamics(turns)
-            
-            return turns, dynamics
-            
-        except Exception as e:
+        except (ET.ParseError, OSError) as e:
             logger.error(f"Failed to extract turns from {xml_path}: {e}")
             raise
+        
+        # Extract all turns
+        turns = self._extract_turn_data(tree.getroot())
+        
+        # Calculate conversation dynamics
+        dynamics = self._calculate_dynamics(turns)
+        
+        return turns, dynamics
     
     def _extract_turn_data(self, root: ET.Element) -> List[TurnData]:
         """Extract all turn data from XML."""
-        turns = []
+        turns: List[TurnData] = []
         
         # Find turn_level section
         turn_level = root.find(".//turn_level")
@@ -126,22 +144,20 @@ class TurnExtractor:
             return None
         
         try:
-            turn_number = int(turn_id_elem.text)
+            turn_number = int(turn_id_elem.text or "")
         except (ValueError, TypeError):
             logger.warning(f"Invalid turn_id: {turn_id_elem.text}")
             return None
         
         # Get speaker
-        speaker_elem = turn_elem.find("speaker")
-        if speaker_elem is None or not speaker_elem.text:
+        speaker = _child_text(turn_elem, "speaker", intern=True)
+        if speaker is None:
             return None
-        speaker = speaker_elem.text.strip()
         
         # Get text
-        text_elem = turn_elem.find("text")
-        if text_elem is None or not text_elem.text:
+        text = _child_text(turn_elem, "text")
+        if text is None:
             return None
-        text = text_elem.text.strip()
         
         # Create turn data
         turn_data = TurnData(
@@ -175,16 +191,14 @@ class TurnExtractor:
             return
         
         # Primary function
-        primary_elem = func_elem.find("primary_function")
-        if primary_elem is not None and primary_elem.text:
-            turn_data.primary_function = primary_elem.text.strip()
+        turn_data.primary_function = _child_text(func_elem, "primary_function", intern=True)
         
         # Secondary functions
         secondary_elem = func_elem.find("secondary_functions")
         if secondary_elem is not None:
             for func in secondary_elem.findall("function"):
                 if func.text:
-                    turn_data.secondary_functions.append(func.text.strip())
+                    turn_data.secondary_functions.append(sys.intern(func.text.strip()))
     
     def _extract_content_annotation(self, turn_elem: ET.Element, turn_data: TurnData) -> None:
         """Extract content annotation from turn."""
@@ -199,12 +213,10 @@ class TurnExtractor:
             topics_text = topics_elem.text.strip()
             if topics_text.startswith("[") and topics_text.endswith("]"):
                 topics_text = topics_text[1:-1]
-                turn_data.topics = [t.strip() for t in topics_text.split(",")]
+                turn_data.topics = [sys.intern(t.strip()) for t in topics_text.split(",")]
         
         # Topic narrative
-        narrative_elem = content_elem.find("topic_narrative")
-        if narrative_elem is not None and narrative_elem.text:
-            turn_data.topic_narrative = narrative_elem.text.strip()
+        turn_data.topic_narrative = _child_text(content_elem, "topic_narrative")
         
         # Geographic scope
         geo_elem = content_elem.find("geographic_scope")
@@ -216,9 +228,7 @@ class TurnExtractor:
                 turn_data.geographic_scope = [g.strip() for g in geo_text.split(",")]
         
         # Temporal reference
-        temporal_elem = content_elem.find("temporal_reference")
-        if temporal_elem is not None and temporal_elem.text:
-            turn_data.temporal_reference = temporal_elem.text.strip()
+        turn_data.temporal_reference = _child_text(content_elem, "temporal_reference", intern=True)
         
         # Actors mentioned
         actors_elem = content_elem.find("actors_mentioned")
@@ -235,19 +245,13 @@ class TurnExtractor:
             return
         
         # Evidence type
-        type_elem = evidence_elem.find("evidence_type")
-        if type_elem is not None and type_elem.text:
-            turn_data.evidence_type = type_elem.text.strip()
+        turn_data.evidence_type = _child_text(evidence_elem, "evidence_type", intern=True)
         
         # Evidence narrative
-        narrative_elem = evidence_elem.find("evidence_narrative")
-        if narrative_elem is not None and narrative_elem.text:
-            turn_data.evidence_narrative = narrative_elem.text.strip()
+        turn_data.evidence_narrative = _child_text(evidence_elem, "evidence_narrative")
         
         # Specificity
-        spec_elem = evidence_elem.find("specificity")
-        if spec_elem is not None and spec_elem.text:
-            turn_data.specificity = spec_elem.text.strip()
+        turn_data.specificity = _child_text(evidence_elem, "specificity", intern=True)
     
     def _extract_stance_annotation(self, turn_elem: ET.Element, turn_data: TurnData) -> None:
         """Extract stance/emotional annotation from turn."""
@@ -256,9 +260,7 @@ class TurnExtractor:
             return
         
         # Emotional valence
-        valence_elem = stance_elem.find("emotional_valence")
-        if valence_elem is not None and valence_elem.text:
-            turn_data.emotional_valence = valence_elem.text.strip()
+        turn_data.emotional_valence = _child_text(stance_elem, "emotional_valence", intern=True)
         
         # Emotional intensity
         intensity_elem = stance_elem.find("emotional_intensity")
@@ -269,10 +271,9 @@ class TurnExtractor:
                 pass
         
         # Emotional narrative
-        narrative_elem = stance_elem.find("emotional_narrative")
-        if narrative_elem is not None and narrative_elem.text:
+        narrative = _child_text(stance_elem, "emotional_narrative")
+        if narrative:
             # Could parse this for emotional categories
-            narrative = narrative_elem.text.strip()
             # Simple extraction of emotions mentioned
             emotions = ["anger", "fear", "sadness", "joy", "frustration", "hope", "anxiety"]
             for emotion in emotions:
@@ -299,9 +300,7 @@ class TurnExtractor:
             turn_data.ambiguous_function = ambiguous_elem.text.lower() == "true"
         
         # Uncertainty notes
-        notes_elem = uncertainty_elem.find("uncertainty_notes")
-        if notes_elem is not None and notes_elem.text:
-            turn_data.uncertainty_notes = notes_elem.text.strip()
+        turn_data.uncertainty_notes = _child_text(uncertainty_elem, "uncertainty_notes")
     
     def _calculate_dynamics(self, turns: List[TurnData]) -> ConversationData:
         """Calculate conversation dynamics from turns."""
@@ -316,18 +315,20 @@ class TurnExtractor:
         dynamics.participant_turns = dynamics.total_turns - dynamics.interviewer_turns
         
         # Average turn length
-        total_words = sum(t.word_count for t in turns)
+        total_words: int = sum(t.word_count for t in turns)
         dynamics.average_turn_length = total_words / len(turns) if turns else 0
         
         # Question count (turns with question function)
         dynamics.question_count = sum(1 for t in turns if t.primary_function == "question")
         
         # Topic shifts (simplified - when consecutive turns have different topics)
-        topic_shifts = 0
-        for i in range(1, len(turns)):
-            if turns[i].topics and turns[i-1].topics:
-                if not set(turns[i].topics).intersection(set(turns[i-1].topics)):
-                    topic_shifts += 1
+        # Each turn's topics become a set once, not once per adjacent pair
+        topic_sets = [frozenset(t.topics) for t in turns]
+        topic_shifts: int = 0
+        i: int
+        for i in range(1, len(topic_sets)):
+            if topic_sets[i] and topic_sets[i-1] and topic_sets[i].isdisjoint(topic_sets[i-1]):
+                topic_shifts += 1
         dynamics.topic_shifts = topic_shifts
         
         # Speaker balance
@@ -3,10 +3,12 @@ Full end-to-end pipeline for interview processing.
 Combines ingestion, annotation, extraction, and database storage.
 """
 import logging
+import os
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from config.settings import CACHE_DIR
 from src.config.config_loader import get_config
 from src.pipeline.ingestion.document_processor import DocumentProcessor, InterviewDocument
 from src.pipeline.annotation.annotation_engine import AnnotationEngine
@@ -22,22 +24,31 @@ class FullPipeline:
     Orchestrates the complete interview analysis pipeline.
     """
     
+    # Number of interviews committed per database transaction in batch mode
+    DB_BATCH_SIZE = 50
+    
+    # Interview file extensions, in the order batches process them
+    INTERVIEW_EXTENSIONS = ('txt', 'docx', 'odt')
+    
     def __init__(self):
         """Initialize pipeline components."""
         self.config = get_config()
-        self.document_processor = DocumentProcessor()
+        self.document_processor = DocumentProcessor(cache_dir=CACHE_DIR)
         self.annotation_engine = AnnotationEngine()
         self.data_extractor = DataExtractor()
         
         logger.info(f"Pipeline initialized with {self.config.ai.provider}/{self.config.ai.model}")
     
-    def process_interview(self, file_path: Path, save_to_db: bool = True) -> Dict[str, Any]:
+    def process_interview(self, file_path: Path, save_to_db: bool = True,
+                          pending_writes: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Process a single interview through the full pipeline.
         
         Args:
             file_path: Path to interview file
             save_to_db: Whether to save results to database
+            pending_writes: If given, database records are appended here for
+                the caller to persist instead of being committed immediately
             
         Returns:
             Dictionary with processing results
@@ -98,19 +109,15 @@ class FullPipeline:
             
             # Step 4: Database Storage
             if save_to_db:
-                logger.info(f"Saving to database for {interview.id}")
-                db = get_db()
-                with db.get_session() as session:
-                    repo = ExtractedDataRepository(session)
-                    
-                    # Convert XML to string for storage
-                    import xml.etree.ElementTree as ET
-                    xml_string = ET.tostring(annotation_xml, encoding='unicode')
-                    
-                    repo.save_extracted_data(extracted_data, xml_content=xml_string, raw_text=interview.text)
-                    
-                    # Log processing
-                    log_entry = ProcessingLog(
+                record = {
+                    'file_path': str(file_path),
+                    'result': results,
+                    'started_at': start_time,
+                    'extracted_data': extracted_data,
+                    'xml_content': xml_string,
+                    'raw_text': interview.text,
+                    'word_count': interview.word_count,
+                    'log_entry': ProcessingLog(
                         interview_id=interview.id,
                         activity_type='full_pipeline',
                         status='completed',
@@ -124,10 +131,15 @@ class FullPipeline:
                         started_at=start_time,
                         completed_at=datetime.now()
                     )
-                    session.add(log_entry)
-                    session.commit()
+                }
                 
-                results['steps_completed'].append('database')
+                if pending_writes is not None:
+                    # Batch mode: the caller persists records in shared transactions
+                    pending_writes.append(record)
+                else:
+                    logger.info(f"Saving to database for {interview.id}")
+                    self._persist_records([record])
+                    results['steps_completed'].append('database')
             
             results['success'] = True
             results['total_time'] = (datetime.now() - start_time).total_seconds()
@@ -140,23 +152,27 @@ class FullPipeline:
             
             # Log failure to database
             if save_to_db and results['interview_id']:
-                try:
-                    with get_session() as session:
-                        log_entry = ProcessingLog(
-                            interview_id=results['interview_id'],
-                            activity_type='full_pipeline',
-                            status='failed',
-                            error_message=str(e),
-                            duration=(datetime.now() - start_time).total_seconds(),
-                            started_at=start_time
-                        )
-                        session.add(log_entry)
-                        session.commit()
-                except Exception as db_error:
-                    logger.error(f"Failed to log error to database: {db_error}")
+                self._log_failure(results['interview_id'], e, start_time)
         
         return results
     
+    def _log_failure(self, interview_id: str, error: Exception, start_time: datetime) -> None:
+        """Record a failed pipeline run in the processing log."""
+        try:
+            with get_session() as session:
+                log_entry = ProcessingLog(
+                    interview_id=interview_id,
+                    activity_type='full_pipeline',
+                    status='failed',
+                    error_message=str(error),
+                    duration=(datetime.now() - start_time).total_seconds(),
+                    started_at=start_time
+                )
+                session.add(log_entry)
+                session.commit()
+        except Exception as db_error:
+            logger.error(f"Failed to log error to database: {db_error}")
+    
     def process_batch(self, input_dir: Path, limit: Optional[int] = None,
                      save_to_db: bool = True) -> Dict[str, Any]:
         """
@@ -173,9 +189,7 @@ class FullPipeline:
         start_time = datetime.now()
         
         # Find interview files
-        files = []
-        for pattern in ['*.txt', '*.docx', '*.odt']:
-            files.extend(input_dir.glob(pattern))
+        files = self._find_interview_files(input_dir)
         
         if limit:
             files = files[:limit]
@@ -191,26 +205,36 @@ class FullPipeline:
             'errors': []
         }
         
-        for i, file_path in enumerate(files, 1):
-            logger.info(f"Processing file {i}/{len(files)}: {file_path.name}")
-            
-            file_result = self.process_interview(file_path, save_to_db)
-            
-            if file_result['success']:
-                results['successful'] += 1
-            else:
-                results['failed'] += 1
-                results['errors'].append({
+        pending_writes: List[Dict[str, Any]] = []
+        
+        try:
+            for i, file_path in enumerate(files, 1):
+                logger.info(f"Processing file {i}/{len(files)}: {file_path.name}")
+                
+                file_result = self.process_interview(file_path, save_to_db, pending_writes=pending_writes)
+                
+                if file_result['success']:
+                    results['successful'] += 1
+                else:
+                    results['failed'] += 1
+                    results['errors'].append({
+                        'file': str(file_path),
+                        'errors': file_result['errors']
+                    })
+                
+                results['files_processed'].append({
                     'file': str(file_path),
-                    'errors': file_result['errors']
+                    'interview_id': file_result['interview_id'],
+                    'success': file_result['success'],
+                    'time': file_result.get('total_time', 0)
                 })
-            
-            results['files_processed'].append({
-                'file': str(file_path),
-                'interview_id': file_result['interview_id'],
-                'success': file_result['success'],
-                'time': file_result.get('total_time', 0)
-            })
+                
+                if len(pending_writes) >= self.DB_BATCH_SIZE:
+                    self._flush_pending_writes(pending_writes, results)
+        finally:
+            # Save interviews already annotated even if the batch is interrupted
+            if pending_writes:
+                self._flush_pending_writes(pending_writes, results)
         
         results['total_time'] = (datetime.now() - start_time).total_seconds()
         results['avg_time_per_file'] = results['total_time'] / len(files) if files else 0
@@ -219,6 +243,85 @@ class FullPipeline:
         
         return results
     
+    def _find_interview_files(self, input_dir: Path) -> List[Path]:
+        """Find interview files with a single directory scan."""
+        files_by_ext = {ext: [] for ext in self.INTERVIEW_EXTENSIONS}
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                ext = os.path.splitext(entry.name)[1][1:].lower()
+                if ext in files_by_ext and entry.is_file():
+                    files_by_ext[ext].append(Path(entry.path))
+        
+        return [path for ext in self.INTERVIEW_EXTENSIONS for path in files_by_ext[ext]]
+    
+    def _persist_records(self, records: List[Dict[str, Any]]) -> None:
+        """Save extracted data and processing logs in a single transaction."""
+        db = get_db()
+        with db.get_session() as session:
+            repo = ExtractedDataRepository(session)
+            for record in records:
+                repo.save_extracted_data(
+                    record['extracted_data'],
+                    xml_content=record['xml_content'],
+                    raw_text=record['raw_text'],
+                    commit=False,
+                    word_count=record.get('word_count')
+                )
+            session.add_all([record['log_entry'] for record in records])
+    
+    def _flush_pending_writes(self, pending_writes: List[Dict[str, Any]],
+                              results: Dict[str, Any]) -> None:
+        """
+        Persist buffered batch records in one transaction.
+        
+        If the shared transaction fails, each record is retried in its own
+        transaction so that only interviews which cannot be saved are marked
+        failed; the rest keep the annotation work already paid for.
+        """
+        logger.info(f"Saving {len(pending_writes)} interviews to database")
+        try:
+            try:
+                self._persist_records(pending_writes)
+                saved = list(pending_writes)
+            except Exception as e:
+                logger.warning(f"Failed to save batch to database, retrying interviews individually: {e}")
+                saved = []
+                for record in pending_writes:
+                    try:
+                        self._persist_records([record])
+                        saved.append(record)
+                    except Exception as record_error:
+                        self._mark_write_failed(record, record_error, results)
+            
+            for record in saved:
+                record['result']['steps_completed'].append('database')
+        finally:
+            pending_writes.clear()
+    
+    def _mark_write_failed(self, record: Dict[str, Any], error: Exception,
+                           results: Dict[str, Any]) -> None:
+        """Mark one buffered interview failed after its database write failed."""
+        logger.error(f"Failed to save {record['file_path']} to database: {error}")
+        
+        file_result = record['result']
+        file_result['success'] = False
+        file_result['errors'].append(str(error))
+        
+        for entry in results['files_processed']:
+            if entry['file'] == record['file_path'] and entry['success']:
+                entry['success'] = False
+                results['successful'] -= 1
+                results['failed'] += 1
+                results['errors'].append({
+                    'file': entry['file'],
+                    'errors': [str(error)]
+                })
+                break
+        
+        self._log_failure(file_result['interview_id'], error, record['started_at'])
+    
     def _save_annotation_xml(self, interview_id: str, annotation_xml) -> Path:
         """Save XML annotation to file."""
         output_dir = Path(self.config.processing.output_dir) / "annotations" / "xml"
@@ -255,9 +358,7 @@ class FullPipeline:
             Cost estimation details
         """
         # Find interview files
-        files = []
-        for pattern in ['*.txt', '*.docx', '*.odt']:
-            files.extend(input_dir.glob(pattern))
+        files = self._find_interview_files(input_dir)
         
         if limit:
             files = files[:limit]
@@ -275,7 +376,7 @@ class FullPipeline:
         for file_path in sample_files:
             try:
                 interview = self.document_processor.process_interview(file_path)
-                word_count = len(interview.text.split())
+                word_count = interview.word_count
                 total_words += word_count
                 
                 # Get cost for this interview
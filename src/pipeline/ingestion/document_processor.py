@@ -2,20 +2,74 @@
 Document processing module for interview ingestion.
 """
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, IO, List, Optional, Tuple
 import re
-from dataclasses import dataclass
+import os
+import mmap
+import hashlib
+import pickle
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, replace
 from datetime import datetime
 import logging
 
-try:
-    import docx
-except ImportError:
-    docx = None
-    logging.warning("python-docx not installed. DOCX support disabled.")
-
 logger = logging.getLogger(__name__)
 
+# WordprocessingML element tags used when reading word/document.xml
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = f'{_W_NS}body'
+_W_P = f'{_W_NS}p'
+_W_R = f'{_W_NS}r'
+_W_T = f'{_W_NS}t'
+_W_BR = f'{_W_NS}br'
+_W_HYPERLINK = f'{_W_NS}hyperlink'
+_W_TYPE = f'{_W_NS}type'
+
+# Run children rendered as fixed characters, as python-docx does
+_W_RUN_CHARS = {
+    f'{_W_NS}tab': '\t',
+    f'{_W_NS}ptab': '\t',
+    f'{_W_NS}cr': '\n',
+    f'{_W_NS}noBreakHyphen': '-',
+}
+
+# Whitespace-delimited word, counted without materializing a token list
+_WORD_PATTERN = re.compile(r'\S+')
+
+# Filename format "T - 20250528 0900 58"; "20250528_0900_058" is parsed by position
+_T_FILENAME_PATTERN = re.compile(r'T\s*-\s*(\d{8})\s+(\d{4})\s+(\d+)')
+
+# Common location indicators
+_LOCATION_PATTERNS = tuple(re.compile(p) for p in (
+    r'lugar:\s*([^\n]+)',
+    r'ubicación:\s*([^\n]+)',
+    r'localidad:\s*([^\n]+)',
+    r'ciudad:\s*([^\n]+)',
+    r'barrio:\s*([^\n]+)',
+))
+
+# Lower-cased speaker labels used by interviewers, not counted as participants
+_INTERVIEWER_MARKERS = frozenset(('entrevistador', 'e', 'ent'))
+
+# Speaker labels that may carry a number, e.g. "Participante 2:"
+_NUMBERED_SPEAKER_PREFIXES = ('Entrevistado', 'Participante')
+
+# Location mappings for Uruguay departments
+_URUGUAY_DEPARTMENTS = {
+    'montevideo', 'canelones', 'maldonado', 'rocha', 'treinta y tres',
+    'cerro largo', 'rivera', 'artigas', 'salto', 'paysandú', 'río negro',
+    'soriano', 'colonia', 'san josé', 'flores', 'florida', 'lavalleja',
+    'durazno', 'tacuarembó'
+}
+
+# All department names in one alternation, longest first
+_DEPARTMENT_PATTERN = re.compile(
+    '|'.join(map(re.escape, sorted(_URUGUAY_DEPARTMENTS, key=len, reverse=True)))
+)
+
 
 @dataclass
 class InterviewDocument:
@@ -29,42 +83,130 @@ class InterviewDocument:
     text: str
     metadata: Dict[str, Any]
     file_path: str
+    
+    @property
+    def word_count(self) -> int:
+        """Number of words in the text, as counted at ingestion."""
+        word_count = self.metadata.get('word_count')
+        if word_count is None:
+            word_count = sum(1 for _ in _WORD_PATTERN.finditer(self.text))
+        return word_count
 
 
 class DocumentProcessor:
     """Processes interview documents from various formats."""
     
     # Location mappings for Uruguay departments
-    URUGUAY_DEPARTMENTS = {
-        'montevideo', 'canelones', 'maldonado', 'rocha', 'treinta y tres',
-        'cerro largo', 'rivera', 'artigas', 'salto', 'paysandú', 'río negro',
-        'soriano', 'colonia', 'san josé', 'flores', 'florida', 'lavalleja',
-        'durazno', 'tacuarembó'
-    }
+    URUGUAY_DEPARTMENTS = _URUGUAY_DEPARTMENTS
+    
+    # Number of processed documents kept in memory, least recently used evicted first
+    MEMORY_CACHE_SIZE = 128
+    
+    # Bump when InterviewDocument or extraction changes so stale pickles are ignored
+    CACHE_FORMAT_VERSION = 1
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize document processor.
+        
+        Args:
+            cache_dir: Directory for persisting processed documents across runs
+                (e.g. data/cache); documents are only cached in memory if None
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._cache: 'OrderedDict[Tuple[str, int, int], InterviewDocument]' = OrderedDict()
     
     def process_interview(self, file_path: Path) -> InterviewDocument:
         """Extract text and metadata from interview document."""
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        # Unchanged files are served from cache, keyed on path, mtime and size
+        stat = file_path.stat()
+        key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        
+        interview = self._cache.get(key)
+        if interview is None:
+            interview = self._load_from_disk_cache(key)
+            if interview is None:
+                interview = self._process_file(file_path)
+                self._save_to_disk_cache(key, interview)
+            self._cache[key] = interview
+            if len(self._cache) > self.MEMORY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        
+        # Hand out a copy so callers can't alter the cached metadata
+        return replace(interview, metadata=dict(interview.metadata))
+    
+    def process_interviews(self, file_paths: List[Path],
+                           max_workers: Optional[int] = None) -> List[InterviewDocument]:
+        """
+        Process many interview documents in parallel worker processes.
+        
+        Args:
+            file_paths: Interview documents to process
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            InterviewDocument objects in the same order as file_paths
+        """
+        paths = [Path(p) for p in file_paths]
+        if len(paths) <= 1:
+            return [self.process_interview(path) for path in paths]
+        
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(_process_in_worker, paths,
+                                     [self.cache_dir] * len(paths), chunksize=4))
+    
+    def _process_file(self, file_path: Path) -> InterviewDocument:
+        """Dispatch to the processor for the file's format."""
         if file_path.suffix.lower() == '.docx':
-            if docx is None:
-                raise ImportError("python-docx is required for DOCX files")
             return self._process_docx(file_path)
         elif file_path.suffix.lower() == '.txt':
             return self._process_txt(file_path)
         else:
             raise ValueError(f"Unsupported file type: {file_path.suffix}")
     
+    def _disk_cache_path(self, cache_dir: Path, key: Tuple[str, int, int]) -> Path:
+        """Path of the pickled document for a cache key and format version."""
+        digest = hashlib.sha256(repr((self.CACHE_FORMAT_VERSION, key)).encode('utf-8')).hexdigest()
+        return cache_dir / f"{digest}.pkl"
+    
+    def _load_from_disk_cache(self, key: Tuple[str, int, int]) -> Optional[InterviewDocument]:
+        """Load a previously processed document from the disk cache, if any."""
+        if self.cache_dir is None:
+            return None
+        
+        cache_path = self._disk_cache_path(self.cache_dir, key)
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+    
+    def _save_to_disk_cache(self, key: Tuple[str, int, int], interview: InterviewDocument):
+        """Persist a processed document to the disk cache, if enabled."""
+        if self.cache_dir is None:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._disk_cache_path(self.cache_dir, key), 'wb') as f:
+                pickle.dump(interview, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {key[0]}: {e}")
+    
     def _process_docx(self, file_path: Path) -> InterviewDocument:
         """Process DOCX file."""
-        doc = docx.Document(str(file_path))
-        
-        # Extract all text
-        full_text = []
-        for para in doc.paragraphs:
-            if para.text.strip():
-                full_text.append(para.text.strip())
+        # Stream paragraphs straight out of the package's main document part
+        with zipfile.ZipFile(file_path) as archive, archive.open('word/document.xml') as xml_file:
+            full_text = self._extract_docx_paragraphs(xml_file)
         
         text = '\n'.join(full_text)
         
@@ -83,10 +225,63 @@ class DocumentProcessor:
             file_path=str(file_path)
         )
     
+    def _extract_docx_paragraphs(self, xml_file: IO[bytes]) -> List[str]:
+        """
+        Extract stripped, non-empty body paragraphs from word/document.xml.
+        
+        Elements are discarded as soon as each top-level block is read, so
+        memory stays flat regardless of document length.
+        """
+        paragraphs = []
+        body = None
+        body_depth = 0
+        depth = 0
+        
+        for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if body is None and elem.tag == _W_BODY:
+                    body, body_depth = elem, depth
+                continue
+            
+            if body is not None and depth == body_depth + 1:
+                if elem.tag == _W_P:
+                    text = self._docx_paragraph_text(elem).strip()
+                    if text:
+                        paragraphs.append(text)
+                # Drop completed top-level blocks (paragraphs, tables)
+                body.clear()
+            depth -= 1
+        
+        return paragraphs
+    
+    def _docx_paragraph_text(self, paragraph: ET.Element) -> str:
+        """Concatenate the text of a paragraph's runs, including hyperlink runs."""
+        parts = []
+        for child in paragraph:
+            if child.tag == _W_R:
+                runs = [child]
+            elif child.tag == _W_HYPERLINK:
+                runs = child.findall(_W_R)
+            else:
+                continue
+            
+            for run in runs:
+                for node in run:
+                    if node.tag == _W_T:
+                        parts.append(node.text or '')
+                    elif node.tag == _W_BR:
+                        # Page and column breaks carry no text
+                        if node.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                            parts.append('\n')
+                    elif node.tag in _W_RUN_CHARS:
+                        parts.append(_W_RUN_CHARS[node.tag])
+        
+        return ''.join(parts)
+    
     def _process_txt(self, file_path: Path) -> InterviewDocument:
         """Process TXT file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            text = f.read()
+        text = self._read_text(file_path)
         
         # Extract metadata
         metadata = self._extract_metadata(file_path.name, text)
@@ -103,108 +298,147 @@ class DocumentProcessor:
             file_path=str(file_path)
         )
     
+    def _read_text(self, file_path: Path) -> str:
+        """
+        Read a UTF-8 text file, decoding straight from a memory map.
+        
+        This avoids holding a separate bytes copy of the whole file while it
+        is decoded. Line endings are translated to '\\n' as in text mode.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, 'utf-8')
+        
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
     def _extract_metadata(self, filename: str, text: str) -> Dict[str, Any]:
         """Extract metadata from filename and text content."""
-        metadata = {}
+        metadata: Dict[str, Any] = {}
         
         # Extract from filename
         # Expected format: "20250528_0900_058.txt" or "T - 20250528 0900 58.docx"
         filename_clean = filename.replace('.txt', '').replace('.docx', '')
         
         # Try different filename patterns
-        # Pattern 1: YYYYMMDD_HHMM_ID
-        match = re.match(r'(\d{8})_(\d{4})_(\d+)', filename_clean)
-        if match:
-            date_str, time_str, id_str = match.groups()
+        filename_parts = self._parse_filename(filename_clean)
+        if filename_parts:
+            date_str, time_str, id_str = filename_parts
             metadata['date'] = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
             metadata['time'] = f"{time_str[:2]}:{time_str[2:]}"
             metadata['id'] = id_str
         else:
-            # Pattern 2: T - YYYYMMDD HHMM ID
-            match = re.match(r'T\s*-\s*(\d{8})\s+(\d{4})\s+(\d+)', filename_clean)
-            if match:
-                date_str, time_str, id_str = match.groups()
-                metadata['date'] = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                metadata['time'] = f"{time_str[:2]}:{time_str[2:]}"
-                metadata['id'] = id_str
-            else:
-                # Fallback
-                metadata['date'] = datetime.now().strftime('%Y-%m-%d')
-                metadata['time'] = '00:00'
-                metadata['id'] = filename_clean
+            # Fallback
+            metadata['date'] = datetime.now().strftime('%Y-%m-%d')
+            metadata['time'] = '00:00'
+            metadata['id'] = filename_clean
         
-        # Extract location and participant info from text
-        metadata['location'] = self._detect_location(text)
-        metadata['department'] = self._detect_department(text)
-        metadata['participant_count'] = self._count_participants(text)
+        # Extract location and participant info from text, lowering and
+        # splitting the document head once for all detectors
+        prefix_lower = text[:1000].lower()
+        lines = text.split('\n', 100)[:100]
+        metadata['location'] = self._detect_location(prefix_lower)
+        metadata['department'] = self._detect_department(prefix_lower)
+        metadata['participant_count'] = self._count_participants(lines)
         
         # Additional metadata
         metadata['filename'] = filename
         metadata['text_length'] = len(text)
-        metadata['word_count'] = len(text.split())
+        metadata['word_count'] = sum(1 for _ in _WORD_PATTERN.finditer(text))
         
         return metadata
     
-    def _detect_location(self, text: str) -> str:
-        """Detect interview location from text."""
+    def _parse_filename(self, filename: str) -> Optional[Tuple[str, str, str]]:
+        """Split a filename into (date, time, id) digit strings, or None if unrecognized."""
+        # Pattern 1: YYYYMMDD_HHMM_ID, checked by position without the regex engine
+        if (len(filename) > 14 and filename[8] == '_' and filename[13] == '_'
+                and filename[:8].isdecimal() and filename[9:13].isdecimal()):
+            end = 14
+            while end < len(filename) and filename[end].isdecimal():
+                end += 1
+            if end > 14:
+                return filename[:8], filename[9:13], filename[14:end]
+        
+        # Pattern 2: T - YYYYMMDD HHMM ID
+        if filename.startswith('T'):
+            match = _T_FILENAME_PATTERN.match(filename)
+            if match:
+                return match.group(1), match.group(2), match.group(3)
+        
+        return None
+    
+    def _detect_location(self, prefix_lower: str) -> str:
+        """Detect interview location from the lower-cased document prefix."""
         # Look for location patterns in first 500 chars
-        text_start = text[:500].lower()
-        
-        # Common location indicators
-        location_patterns = [
-            r'lugar:\s*([^\n]+)',
-            r'ubicación:\s*([^\n]+)',
-            r'localidad:\s*([^\n]+)',
-            r'ciudad:\s*([^\n]+)',
-            r'barrio:\s*([^\n]+)'
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text_start)
+        text_start = prefix_lower[:500]
+        
+        for pattern in _LOCATION_PATTERNS:
+            match = pattern.search(text_start)
             if match:
                 return match.group(1).strip().title()
         
         # Check for department names
-        for dept in self.URUGUAY_DEPARTMENTS:
-            if dept in text_start:
-                return dept.title()
+        match = _DEPARTMENT_PATTERN.search(text_start)
+        if match:
+            return match.group(0).title()
         
         return "Unknown"
     
-    def _detect_department(self, text: str) -> Optional[str]:
-        """Detect Uruguay department from text."""
-        text_lower = text[:1000].lower()
-        
-        for dept in self.URUGUAY_DEPARTMENTS:
-            if dept in text_lower:
-                return dept.title()
-        
-        return None
+    def _detect_department(self, prefix_lower: str) -> Optional[str]:
+        """Detect Uruguay department from the lower-cased document prefix."""
+        match = _DEPARTMENT_PATTERN.search(prefix_lower[:1000])
+        return match.group(0).title() if match else None
     
-    def _count_participants(self, text: str) -> int:
-        """Count number of participants in interview."""
-        # Look for speaker indicators
-        speaker_patterns = [
-            r'^[A-Z]{2,3}:',  # Initials like "AM:", "JP:"
-            r'^\w+:',  # Names like "Juan:"
-            r'Entrevistado\s*\d*:',
-            r'Participante\s*\d*:'
-        ]
-        
+    def _count_participants(self, lines: List[str]) -> int:
+        """Count number of participants from the document's opening lines."""
         speakers = set()
-        lines = text.split('\n')
         
         for line in lines[:100]:  # Check first 100 lines
-            for pattern in speaker_patterns:
-                match = re.match(pattern, line.strip())
-                if match:
-                    speaker = match.group(0).rstrip(':')
-                    # Exclude common interviewer markers
-                    if speaker.lower() not in ['entrevistador', 'e', 'ent']:
-                        speakers.add(speaker)
+            speaker = self._classify_speaker(line.strip())
+            # Exclude common interviewer markers
+            if speaker and speaker.lower() not in _INTERVIEWER_MARKERS:
+                speakers.add(speaker)
         
         # If no speakers found, assume 1 participant
         return max(len(speakers), 1)
+    
+    def _classify_speaker(self, line: str) -> Optional[str]:
+        """
+        Return the speaker label a stripped line opens with, or None.
+        
+        A label is the text before the first colon when it is a single word
+        ("AM:", "Juan:") or a numbered label ("Participante 2:").
+        """
+        colon = line.find(':')
+        if colon <= 0:
+            return None
+        
+        head = line[:colon]
+        # Word characters only, underscore included
+        if head.replace('_', 'a').isalnum():
+            return head
+        
+        for prefix in _NUMBERED_SPEAKER_PREFIXES:
+            if head.startswith(prefix):
+                number = head[len(prefix):].lstrip()
+                return head if not number or number.isdecimal() else None
+        
+        return None
+
+
+# Processor reused by all tasks a worker process runs
+_worker_processor: Optional[DocumentProcessor] = None
+
+
+def _process_in_worker(file_path: Path, cache_dir: Optional[Path]) -> InterviewDocument:
+    """Process one document inside a worker process of process_interviews."""
+    global _worker_processor
+    if _worker_processor is None or _worker_processor.cache_dir != cache_dir:
+        _worker_processor = DocumentProcessor(cache_dir=cache_dir)
+    return _worker_processor.process_interview(file_path)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ Conversation parser for extracting structured turns from interview text.
 """
 import re
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -21,31 +21,67 @@ class ConversationTurn:
     end_line: int
 
 
+# Speaker alternatives; [^\S\n] keeps whitespace matches within one line
+_SPEAKER_ALTERNATIVES = (
+    r'\[(?P<bracket_initials>[A-Z]{1,4})\]'  # [AM], [CR], [JP], etc.
+    r'|(?P<colon_initials>[A-Z]{1,4}):[^\S\n]*'  # AM:, CR:, JP:
+    r'|(?P<name>[A-Za-z]+[^\S\n]*\d*):[^\S\n]*'  # Entrevistador:, Participante1:
+    r'|\[(?P<bracket_name>[A-Za-z]+(?:[^\S\n]+\d+)?)\]'  # [Entrevistador], [Participante 1]
+)
+
+# Metadata and timestamp line prefixes
+_EXCLUDE_ALTERNATIVES = (
+    r'\d{8}[^\S\n]+\d{4}[^\S\n]+\d+[^\S\n]*$'  # Timestamp patterns like "20250528 0900 58"
+    r'|Id Agenda:'
+    r'|ORGANIZACIÓN:'
+    r'|Localidad:'
+    r'|Fecha de la entrevista:'
+    r'|Entrevistadores:'
+    r'|Entrevistados:'
+    r'|Sobre la institución:'
+    r'|Transcripción hecha por'
+    r'|Entregada el'
+    r'|_{3,}[^\S\n]*$'  # Lines with just underscores
+)
+
+# Common speaker name variations and their canonical (Spanish) forms
+_SPEAKER_ALIASES = {
+    'entrevistador': 'Entrevistador',
+    'ent': 'Entrevistador',
+    'e': 'Entrevistador',
+    'entrevistado': 'Participante',
+    'participante': 'Participante',
+    'p': 'Participante',
+    'moderador': 'Moderador',
+    'mod': 'Moderador',
+    'm': 'Moderador',
+}
+
+
 class ConversationParser:
     """Parses raw interview text into structured conversation turns."""
     
-    # Common speaker patterns in interview transcripts
-    SPEAKER_PATTERNS = [
-        r'^\[([A-Z]{1,4})\]$',  # [AM], [CR], [JP], etc.
-        r'^([A-Z]{1,4}):\s*$',  # AM:, CR:, JP:
-        r'^([A-Za-z]+\s*\d*):\s*$',  # Entrevistador:, Participante1:
-        r'^\[([A-Za-z]+(?:\s+\d+)?)\]$',  # [Entrevistador], [Participante 1]
-    ]
+    # Common speaker patterns in interview transcripts, fused into one
+    # alternation; the named group that matched holds the speaker
+    SPEAKER_PATTERN = re.compile(r'^(?:' + _SPEAKER_ALTERNATIVES + r')$')
     
     # Patterns to exclude (often metadata or timestamps)
-    EXCLUDE_PATTERNS = [
-        r'^\d{8}\s+\d{4}\s+\d+$',  # Timestamp patterns like "20250528 0900 58"
-        r'^Id Agenda:',
-        r'^ORGANIZACIÓN:',
-        r'^Localidad:',
-        r'^Fecha de la entrevista:',
-        r'^Entrevistadores:',
-        r'^Entrevistados:',
-        r'^Sobre la institución:',
-        r'^Transcripción hecha por',
-        r'^Entregada el',
-        r'^_{3,}$',  # Lines with just underscores
-    ]
+    EXCLUDE_PATTERN = re.compile(r'^(?:' + _EXCLUDE_ALTERNATIVES + r')')
+    
+    # Line-anchored variants for scanning a whole transcript at once; each
+    # tolerates the surrounding whitespace that per-line stripping removed
+    SPEAKER_LINE_PATTERN = re.compile(
+        r'^[^\S\n]*(?:' + _SPEAKER_ALTERNATIVES + r')[^\S\n]*$', re.MULTILINE
+    )
+    EXCLUDE_LINE_PATTERN = re.compile(
+        r'^[^\S\n]*(?:' + _EXCLUDE_ALTERNATIVES + r')[^\n]*', re.MULTILINE
+    )
+    
+    # Whitespace spanning a line break, collapsed when joining turn lines
+    LINE_BREAK_PATTERN = re.compile(r'\s*\n\s*')
+    
+    # Whitespace-delimited word, counted without materializing a token list
+    WORD_PATTERN = re.compile(r'\S+')
     
     def parse_conversation(self, raw_text: str) -> List[ConversationTurn]:
         """
@@ -57,153 +93,141 @@ class ConversationParser:
         Returns:
             List of ConversationTurn objects
         """
-        turns = []
-        lines = raw_text.split('\n')
+        # Pass 1: find speaker lines with one scan over the whole transcript,
+        # counting newlines incrementally to recover their line numbers
+        speaker_lines = []
+        line_num = 0
+        last_pos = 0
         
-        current_speaker = None
-        current_speaker_id = None
-        current_text_lines = []
-        current_start_line = None
-        turn_number = 0
+        for match in self.SPEAKER_LINE_PATTERN.finditer(raw_text):
+            if self._should_exclude_line(match.group().strip()):
+                continue
+            
+            line_num += raw_text.count('\n', last_pos, match.start())
+            last_pos = match.start()
+            speaker_info = self._speaker_from_match(match)
+            speaker_lines.append((speaker_info['speaker'], speaker_info['speaker_id'],
+                                  line_num, match.start(), match.end()))
+        
+        total_lines = line_num + raw_text.count('\n', last_pos) + 1
         
-        for line_num, line in enumerate(lines):
-            line = line.strip()
+        # Pass 2: each turn is the text between its speaker line and the next,
+        # with metadata lines removed and line breaks joined by single spaces
+        turns: List[ConversationTurn] = []
+        
+        for index, (speaker, speaker_id, start_line, _, content_start) in enumerate(speaker_lines):
+            if index + 1 < len(speaker_lines):
+                next_line, content_end = speaker_lines[index + 1][2:4]
+            else:
+                next_line, content_end = total_lines, len(raw_text)
             
-            # Skip empty lines and excluded patterns
-            if not line or self._should_exclude_line(line):
+            content = self.EXCLUDE_LINE_PATTERN.sub('', raw_text[content_start:content_end])
+            turn_text = self.LINE_BREAK_PATTERN.sub(' ', content).strip()
+            if not turn_text:  # Only save if there's actual content
                 continue
             
-            # Check if this line indicates a new speaker
-            speaker_match = self._extract_speaker(line)
-            
-            if speaker_match:
-                # Save previous turn if we have one
-                if current_speaker and current_text_lines:
-                    turn_number += 1
-                    turn_text = ' '.join(current_text_lines).strip()
-                    if turn_text:  # Only save if there's actual content
-                        turns.append(ConversationTurn(
-                            turn_number=turn_number,
-                            speaker=current_speaker,
-                            speaker_id=current_speaker_id,
-                            text=turn_text,
-                            word_count=len(turn_text.split()),
-                            start_line=current_start_line,
-                            end_line=line_num - 1
-                        ))
-                
-                # Start new turn
-                current_speaker = speaker_match['speaker']
-                current_speaker_id = speaker_match['speaker_id']
-                current_text_lines = []
-                current_start_line = line_num
-                
-            else:
-                # This is content for the current speaker
-                if current_speaker:
-                    current_text_lines.append(line)
-        
-        # Don't forget the last turn
-        if current_speaker and current_text_lines:
-            turn_number += 1
-            turn_text = ' '.join(current_text_lines).strip()
-            if turn_text:
-                turns.append(ConversationTurn(
-                    turn_number=turn_number,
-                    speaker=current_speaker,
-                    speaker_id=current_speaker_id,
-                    text=turn_text,
-                    word_count=len(turn_text.split()),
-                    start_line=current_start_line,
-                    end_line=len(lines) - 1
-                ))
+            turns.append(ConversationTurn(
+                turn_number=len(turns) + 1,
+                speaker=speaker,
+                speaker_id=speaker_id,
+                text=turn_text,
+                word_count=sum(1 for _ in self.WORD_PATTERN.finditer(turn_text)),
+                start_line=start_line,
+                end_line=next_line - 1
+            ))
         
         logger.info(f"Parsed {len(turns)} conversation turns")
         return turns
     
-    def _extract_speaker(self, line: str) -> Optional[Dict[str, str]]:
+    def _extract_speaker(self, line: str) -> Optional[Dict[str, Any]]:
         """
         Extract speaker information from a line.
         
+        Args:
+            line: Line already stripped of surrounding whitespace
+            
         Returns:
             Dict with 'speaker' and 'speaker_id' keys, or None if no speaker found
         """
-        for pattern in self.SPEAKER_PATTERNS:
-            match = re.match(pattern, line.strip())
-            if match:
-                speaker_raw = match.group(1)
-                
-                # Determine speaker type and ID
-                speaker_id = None
-                speaker = speaker_raw
-                
-                # Handle numbered participants (e.g., "Participante 1")
-                if ' ' in speaker_raw:
-                    parts = speaker_raw.split()
-                    if len(parts) == 2 and parts[1].isdigit():
-                        speaker = parts[0]
-                        speaker_id = parts[1]
-                
-                # Normalize speaker names
-                speaker = self._normalize_speaker_name(speaker)
-                
-                return {
-                    'speaker': speaker,
-                    'speaker_id': speaker_id
-                }
-        
-        return None
+        match = self.SPEAKER_PATTERN.match(line)
+        if not match:
+            return None
+        
+        return self._speaker_from_match(match)
+    
+    def _speaker_from_match(self, match: re.Match) -> Dict[str, Any]:
+        """Build speaker information from a speaker pattern match."""
+        # Exactly one named group takes part in a speaker match
+        speaker_raw = match.group(match.lastgroup or 0)
+        
+        # Determine speaker type and ID
+        speaker_id = None
+        speaker = speaker_raw
+        
+        # Handle numbered participants (e.g., "Participante 1")
+        if ' ' in speaker_raw:
+            parts = speaker_raw.split()
+            if len(parts) == 2 and parts[1].isdigit():
+                speaker = parts[0]
+                speaker_id = parts[1]
+        
+        # Normalize speaker names
+        speaker = self._normalize_speaker_name(speaker)
+        
+        return {
+            'speaker': speaker,
+            'speaker_id': speaker_id
+        }
     
     def _normalize_speaker_name(self, speaker: str) -> str:
         """Normalize speaker names for consistency."""
-        speaker_lower = speaker.lower()
-        
-        # Map common variations (keep Spanish terms)
-        if speaker_lower in ['entrevistador', 'ent', 'e']:
-            return 'Entrevistador'
-        elif speaker_lower in ['entrevistado', 'participante', 'p']:
-            return 'Participante'
-        elif speaker_lower in ['moderador', 'mod', 'm']:
-            return 'Moderador'
-        else:
-            # Keep original for specific initials like AM, CR, JP
-            return speaker.upper()
+        # Map common variations (keep Spanish terms); keep original for
+        # specific initials like AM, CR, JP
+        return _SPEAKER_ALIASES.get(speaker.lower()) or speaker.upper()
     
     def _should_exclude_line(self, line: str) -> bool:
         """Check if a line should be excluded from parsing."""
-        for pattern in self.EXCLUDE_PATTERNS:
-            if re.match(pattern, line):
-                return True
-        return False
+        return self.EXCLUDE_PATTERN.match(line) is not None
     
     def get_conversation_summary(self, turns: List[ConversationTurn]) -> Dict[str, Any]:
         """Generate summary statistics for a conversation."""
         if not turns:
             return {}
         
-        # Count speakers
-        speakers = {}
-        total_words = 0
+        # Count speakers in parallel arrays indexed by first appearance
+        speaker_index: Dict[str, int] = {}
+        speaker_labels: List[Tuple[str, Optional[str]]] = []
+        turn_counts: List[int] = []
+        word_counts: List[int] = []
         
         for turn in turns:
             speaker_key = f"{turn.speaker}_{turn.speaker_id}" if turn.speaker_id else turn.speaker
-            if speaker_key not in speakers:
-                speakers[speaker_key] = {
-                    'speaker': turn.speaker,
-                    'speaker_id': turn.speaker_id,
-                    'turn_count': 0,
-                    'word_count': 0
-                }
+            idx = speaker_index.setdefault(speaker_key, len(speaker_index))
+            if idx == len(turn_counts):
+                speaker_labels.append((turn.speaker, turn.speaker_id))
+                turn_counts.append(0)
+                word_counts.append(0)
             
-            speakers[speaker_key]['turn_count'] += 1
-            speakers[speaker_key]['word_count'] += turn.word_count
-            total_words += turn.word_count
+            turn_counts[idx] += 1
+            word_counts[idx] += turn.word_count
+        
+        total_words = sum(word_counts)
+        speakers = [
+            {
+                'speaker': speaker,
+                'speaker_id': speaker_id,
+                'turn_count': turn_count,
+                'word_count': word_count
+            }
+            for (speaker, speaker_id), turn_count, word_count
+            in zip(speaker_labels, turn_counts, word_counts)
+        ]
         
         return {
             'total_turns': len(turns),
             'total_words': total_words,
             'unique_speakers': len(speakers),
-            'speakers': list(speakers.values()),
+            'speakers': speakers,
             'avg_words_per_turn': total_words / len(turns) if turns else 0
         }
 
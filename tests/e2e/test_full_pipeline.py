@@ -24,7 +24,7 @@ class TestFullPipelineE2E:
     
     @patch('src.pipeline.annotation.annotation_engine.AnnotationEngine.annotate_interview')
     @patch('src.database.repository.ExtractedDataRepository.save_extracted_data')
-    def test_pipeline_process_interview_success(self, mock_save, mock_annotate, sample_interview_file):
+    def test_pipeline_process_interview_success(self, mock_save, mock_annotate, sample_interview_file, tmp_path):
         """Test successful end-to-end interview processing."""
         # Mock AI annotation response
         mock_xml = Mock()
@@ -34,8 +34,9 @@ class TestFullPipelineE2E:
         # Create pipeline
         pipeline = FullPipeline()
         
-        # Process interview
-        result = pipeline.process_interview(sample_interview_file, save_to_db=True)
+        # Process interview, keeping saved annotations out of the real output dir
+        with patch.object(pipeline.config.processing, 'output_dir', str(tmp_path)):
+            result = pipeline.process_interview(sample_interview_file, save_to_db=True)
         
         # Verify success
         assert result['success'] is True
@@ -111,6 +112,82 @@ class TestFullPipelineE2E:
                 assert result['total_files'] == 2
                 assert mock_process.call_count == 2
 
+    def test_pipeline_batch_groups_database_writes(self):
+        """Test that batch processing commits database writes in chunks."""
+        pipeline = FullPipeline()
+        pipeline.DB_BATCH_SIZE = 2
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for i in range(3):
+                (temp_path / f"interview{i}.txt").write_text(f"Sample content {i}")
+
+            def fake_process(file_path, save_to_db, pending_writes=None):
+                result = {'success': True, 'interview_id': file_path.stem,
+                          'steps_completed': ['ingestion'], 'errors': [], 'total_time': 1.0}
+                pending_writes.append({'file_path': str(file_path), 'result': result})
+                return result
+
+            # The buffer is reused between flushes, so record chunk sizes as they happen
+            chunk_sizes = []
+            
+            with patch.object(pipeline, 'process_interview', side_effect=fake_process), \
+                 patch.object(pipeline, '_persist_records',
+                              side_effect=lambda records: chunk_sizes.append(len(records))):
+                result = pipeline.process_batch(temp_path, save_to_db=True)
+
+            # Two transactions: one full chunk of 2, then the remainder
+            assert chunk_sizes == [2, 1]
+            assert result['successful'] == 3
+    
+    def test_pipeline_batch_retries_failed_chunk_individually(self):
+        """Test that a failed batch write only fails the interviews that cannot be saved."""
+        pipeline = FullPipeline()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for i in range(3):
+                (temp_path / f"interview{i}.txt").write_text(f"Sample content {i}")
+            
+            file_results = {}
+            
+            def fake_process(file_path, save_to_db, pending_writes=None):
+                result = {'success': True, 'interview_id': file_path.stem,
+                          'steps_completed': ['ingestion'], 'errors': [], 'total_time': 1.0}
+                file_results[file_path.stem] = result
+                pending_writes.append({'file_path': str(file_path), 'result': result,
+                                       'started_at': None})
+                return result
+            
+            def fake_persist(records):
+                if len(records) > 1 or records[0]['result']['interview_id'] == 'interview1':
+                    raise Exception("constraint violation")
+            
+            with patch.object(pipeline, 'process_interview', side_effect=fake_process), \
+                 patch.object(pipeline, '_persist_records', side_effect=fake_persist), \
+                 patch.object(pipeline, '_log_failure') as mock_log_failure:
+                result = pipeline.process_batch(temp_path, save_to_db=True)
+        
+        assert result['successful'] == 2
+        assert result['failed'] == 1
+        assert 'database' in file_results['interview0']['steps_completed']
+        assert 'database' not in file_results['interview1']['steps_completed']
+        assert file_results['interview1']['success'] is False
+        mock_log_failure.assert_called_once()
+        assert mock_log_failure.call_args.args[0] == 'interview1'
+
+    def test_find_interview_files_matches_extensions_only(self):
+        """Test that files are selected by extension, not by bare name."""
+        pipeline = FullPipeline()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for name in ("interview.txt", "interview.DOCX", "txt", "docx", "notes.md"):
+                (temp_path / name).write_text("content")
+            
+            found = sorted(path.name for path in pipeline._find_interview_files(temp_path))
+        
+        assert found == ["interview.DOCX", "interview.txt"]
 
 @pytest.mark.integration
 class TestPipelineWithRealComponents:
@@ -178,7 +178,7 @@ porque nosotros cobramos por 22 actualmente.
         """Test that speaker identification is accurate across components."""
         # Document processing for participant count
         processor = DocumentProcessor()
-        participant_count = processor._count_participants(sample_complete_interview)
+        participant_count = processor._count_participants(sample_complete_interview.split('\n'))
         
         # Conversation parsing for detailed speaker analysis
         parser = ConversationParser()
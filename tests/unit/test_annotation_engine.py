@@ -5,6 +5,7 @@ import pytest
 import xml.etree.ElementTree as ET
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
+from dataclasses import replace
 
 from src.pipeline.annotation.prompt_manager import PromptManager
 from src.pipeline.annotation.annotation_engine import AnnotationEngine
@@ -49,6 +50,15 @@ class TestPromptManager:
         assert "<annotation_result>" in prompt
         assert "</annotation_result>" in prompt
     
+    def test_annotation_prompt_shares_static_prefix(self, prompt_manager, sample_interview_metadata):
+        """Test that interview content follows the schema, leaving a cacheable prefix."""
+        first = prompt_manager.create_annotation_prompt("First interview", sample_interview_metadata)
+        second = prompt_manager.create_annotation_prompt("Second interview", {"id": "other"})
+        
+        prefix = first[:first.index("<interview_to_annotate>")]
+        assert second.startswith(prefix)
+        assert "annotation_schema" in prefix
+    
     def test_create_empty_annotation_template(self, prompt_manager):
         """Test creating empty annotation template."""
         template = prompt_manager.create_empty_annotation_template("test_001")
@@ -308,4 +318,26 @@ class TestAnnotationEngine:
         
         assert len(results) == 2
         assert all(success for _, success, _ in results)
-        assert mock_client.chat.completions.create.call_count == 2
\ No newline at end of file
+        assert mock_client.chat.completions.create.call_count == 2
+    
+    @patch('os.getenv')
+    @patch('openai.OpenAI')
+    def test_batch_annotate_concurrent_preserves_order(self, mock_openai_class, mock_getenv, mock_interview):
+        """Test concurrent batch annotation keeps results in input order."""
+        mock_getenv.return_value = "fake-api-key"
+        
+        engine = AnnotationEngine(model_provider="openai")
+        
+        def fake_annotate(interview):
+            if interview.id == "test_002":
+                raise Exception("API rate limit exceeded")
+            return Mock(), {}
+        
+        interviews = [replace(mock_interview, id=f"test_00{i}") for i in range(1, 5)]
+        
+        with patch.object(engine, 'annotate_interview', side_effect=fake_annotate):
+            results = engine.batch_annotate(interviews, max_concurrent=3)
+        
+        assert [interview_id for interview_id, _, _ in results] == [i.id for i in interviews]
+        assert [success for _, success, _ in results] == [True, False, True, True]
+        assert results[1][2] == "API rate limit exceeded"
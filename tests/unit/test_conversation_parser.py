@@ -180,6 +180,20 @@ class TestConversationParser:
         assert "tercera línea" in turns[0].text
         assert turns[0].text.count("línea") == 3
 
+    def test_repeated_parse_returns_fresh_turns(self, parser):
+        """Test that repeated parses return independent turns."""
+        text = """
+        [AM]
+        Primera respuesta.
+        """
+        
+        first = parser.parse_conversation(text)
+        first[0].text = "modificado"
+        second = parser.parse_conversation(text)
+        
+        assert second[0].text == "Primera respuesta."
+        assert second[0] is not first[0]
+
 
 class TestConversationTurn:
     """Test cases for ConversationTurn dataclass."""